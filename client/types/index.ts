@@ -15,6 +15,7 @@ export interface Note {
   tags?: string[] | null;
   ai_summary?: string | null;
   ai_tags?: string[] | null;
+  enrichment_status?: "pending" | "done" | "failed" | null;
   is_pinned: boolean;
   is_archived: boolean;
   created_at: string;
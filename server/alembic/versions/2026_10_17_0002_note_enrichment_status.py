@@ -0,0 +1,26 @@
+"""Track background AI enrichment state on notes.
+
+Revision ID: 2026_10_17_0002
+Revises: 2024_10_26_0001
+Create Date: 2026-10-17 00:02:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "2026_10_17_0002"
+down_revision = "2024_10_26_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("notes", sa.Column("enrichment_status", sa.String(length=16), nullable=True))
+    op.execute("UPDATE notes SET enrichment_status = 'done' WHERE ai_summary IS NOT NULL")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("notes") as batch_op:
+        batch_op.drop_column("enrichment_status")
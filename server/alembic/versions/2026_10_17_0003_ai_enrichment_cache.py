@@ -0,0 +1,36 @@
+"""Persistent cache of AI enrichment results.
+
+Revision ID: 2026_10_17_0003
+Revises: 2026_10_17_0002
+Create Date: 2026-10-17 00:03:00
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "2026_10_17_0003"
+down_revision = "2026_10_17_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ai_enrichment_cache",
+        sa.Column("key", sa.String(length=64), primary_key=True),
+        sa.Column("model_name", sa.String(length=100), nullable=False),
+        sa.Column("summary", sa.Text(), nullable=True),
+        sa.Column("tags", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.Integer(), nullable=False),
+        sa.Column("expires_at", sa.Integer(), nullable=False),
+    )
+    op.create_index(
+        op.f("ix_ai_enrichment_cache_expires_at"), "ai_enrichment_cache", ["expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_ai_enrichment_cache_expires_at"), table_name="ai_enrichment_cache")
+    op.drop_table("ai_enrichment_cache")
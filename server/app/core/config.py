@@ -15,6 +15,14 @@ class Settings(BaseSettings):
 
     # AI Service
     GEMINI_API_KEY: str = ""
+    ENRICHMENT_CACHE_SIZE: int = 1024
+    ENRICHMENT_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    ENRICHMENT_CACHE_DB_MAX_ROWS: int = 100000
+
+    # Background enrichment
+    ENRICHMENT_WORKERS: int = 2
+    ENRICHMENT_QUEUE_SIZE: int = 10000
+    ENRICHMENT_BATCH_SIZE: int = 10
 
     # App
     DEBUG: bool = True
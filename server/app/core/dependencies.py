@@ -1,21 +1,23 @@
 from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import get_settings
 from app.core.security import decode_access_token
 from app.db.session import get_db
 from app.db.models.user import User
-from app.services import AINoteService
+from app.services import AINoteService, EnrichmentCache, EnrichmentWorkerPool
 
 # HTTP Bearer token security scheme
 security = HTTPBearer()
 
 _ai_service_instance: Optional[AINoteService] = None
+_enrichment_pool_instance: Optional[EnrichmentWorkerPool] = None
 
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> User:
     """
     Dependency to get the current authenticated user.
@@ -48,12 +50,13 @@ async def get_current_user(
         raise credentials_exception
 
     # Extract user_id from token
-    user_id: Optional[int] = payload.get("sub")
-    if user_id is None:
+    try:
+        user_id = int(payload.get("sub"))
+    except (TypeError, ValueError):
         raise credentials_exception
 
     # Query user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if user is None:
         raise credentials_exception
 
@@ -116,5 +119,25 @@ async def get_ai_service() -> AINoteService:
     """Provide a singleton AI note service."""
     global _ai_service_instance
     if _ai_service_instance is None:
-        _ai_service_instance = AINoteService()
+        settings = get_settings()
+        cache = EnrichmentCache(
+            max_size=settings.ENRICHMENT_CACHE_SIZE,
+            ttl_seconds=settings.ENRICHMENT_CACHE_TTL_SECONDS,
+            max_db_rows=settings.ENRICHMENT_CACHE_DB_MAX_ROWS,
+        )
+        _ai_service_instance = AINoteService(cache=cache, batch_size=settings.ENRICHMENT_BATCH_SIZE)
     return _ai_service_instance
+
+
+async def get_enrichment_pool() -> EnrichmentWorkerPool:
+    """Provide the singleton background enrichment worker pool."""
+    global _enrichment_pool_instance
+    if _enrichment_pool_instance is None:
+        settings = get_settings()
+        _enrichment_pool_instance = EnrichmentWorkerPool(
+            await get_ai_service(),
+            workers=settings.ENRICHMENT_WORKERS,
+            max_queue_size=settings.ENRICHMENT_QUEUE_SIZE,
+            batch_size=settings.ENRICHMENT_BATCH_SIZE,
+        )
+    return _enrichment_pool_instance
@@ -1,4 +1,17 @@
+from sqlalchemy import DateTime
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.declarative import declarative_base
 
 # Base class for all database models
 Base = declarative_base()
+
+# Timezone-aware timestamp. On SQLite, bound values are stored in the same
+# second-resolution text format CURRENT_TIMESTAMP produces, so server-set and
+# Python-bound timestamps compare correctly (e.g. in keyset cursors).
+Timestamp = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d",
+        regexp=r"(\d+)-(\d+)-(\d+) (\d+):(\d+):(\d+)",
+    ),
+    "sqlite",
+)
@@ -1,4 +1,5 @@
 from app.db.models.user import User
 from app.db.models.note import Note
+from app.db.models.enrichment_cache import EnrichmentCacheEntry
 
-__all__ = ["User", "Note"]
+__all__ = ["User", "Note", "EnrichmentCacheEntry"]
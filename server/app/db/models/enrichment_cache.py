@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, Text, JSON
+
+from app.db.base import Base
+
+
+class EnrichmentCacheEntry(Base):
+    """Persisted AI enrichment result keyed by a hash of the model and note text."""
+
+    __tablename__ = "ai_enrichment_cache"
+
+    key = Column(String(64), primary_key=True)
+    model_name = Column(String(100), nullable=False)
+    summary = Column(Text, nullable=True)
+    tags = Column(JSON, nullable=True)
+    created_at = Column(Integer, nullable=False)
+    expires_at = Column(Integer, nullable=False, index=True)
+
+    def __repr__(self) -> str:
+        return f"<EnrichmentCacheEntry(key={self.key}, model_name={self.model_name})>"
@@ -3,7 +3,6 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
-    DateTime,
     Boolean,
     ForeignKey,
     JSON,
@@ -11,8 +10,13 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
-from app.db.base import Base
+from app.db.base import Base, Timestamp
 
+# Lifecycle of the background AI enrichment for a note. ``None`` means
+# enrichment was never requested for the note.
+ENRICHMENT_PENDING = "pending"
+ENRICHMENT_DONE = "done"
+ENRICHMENT_FAILED = "failed"
 
 class Note(Base):
     """Note model storing the raw content plus AI-enriched metadata."""
@@ -26,10 +30,11 @@ class Note(Base):
     tags = Column(JSON, nullable=True)
     ai_summary = Column(Text, nullable=True)
     ai_tags = Column(JSON, nullable=True)
+    enrichment_status = Column(String(16), nullable=True)
     is_pinned = Column(Boolean, default=False, nullable=False)
     is_archived = Column(Boolean, default=False, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.current_timestamp(), onupdate=func.current_timestamp(), nullable=False)
+    created_at = Column(Timestamp, server_default=func.current_timestamp(), nullable=False)
+    updated_at = Column(Timestamp, server_default=func.current_timestamp(), onupdate=func.current_timestamp(), nullable=False)
 
     owner = relationship("User", back_populates="notes")
 
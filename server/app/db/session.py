@@ -1,5 +1,9 @@
+from typing import AsyncIterator
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
 
 from app.core.config import get_settings
 
@@ -7,11 +11,27 @@ settings = get_settings()
 
 database_url = settings.DATABASE_URL or "sqlite:///./app.db"
 
+# Async drivers used by the API for each supported backend.
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+}
+
+
+def to_async_url(url: str) -> str:
+    """Swap the DBAPI in a database URL for its asyncio counterpart."""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        return url
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
 connect_args = {}
 if database_url.startswith("sqlite"):
     connect_args["check_same_thread"] = False
 
-# Create database engine
+# Synchronous engine for background workers, scripts and migrations
 engine = create_engine(
     database_url,
     pool_pre_ping=True,
@@ -22,14 +42,21 @@ engine = create_engine(
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Asyncio engine used by the request handlers
+async_engine = create_async_engine(
+    to_async_url(database_url),
+    pool_pre_ping=True,
+    echo=settings.DEBUG,
+)
+
+# Objects stay loaded after commit; async sessions cannot lazy-load expired attributes.
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 
-def get_db() -> Session:
+async def get_db() -> AsyncIterator[AsyncSession]:
     """
-    Dependency to get database session.
-    Yields a database session and ensures it's closed after use.
+    Dependency to get an async database session.
+    Yields a session and ensures it's closed after use.
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
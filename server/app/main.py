@@ -1,17 +1,34 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import get_settings
+from app.core.dependencies import get_enrichment_pool
 from app.routers import auth, notes
 from app.db.base import Base
-from app.db.session import engine
+from app.db.session import async_engine, engine
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start the background enrichment workers for the lifetime of the app."""
+    enrichment_pool = await get_enrichment_pool()
+    enrichment_pool.start()
+    enrichment_pool.requeue_pending()
+    app.state.enrichment_pool = enrichment_pool
+    yield
+    enrichment_pool.stop(timeout=30)
+    await async_engine.dispose()
+
+
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.VERSION,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    lifespan=lifespan,
 )
 
 # Configure CORS
@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 from app.db.session import get_db
 from app.db.models.user import User
@@ -20,7 +21,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.post("/signup", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
+async def signup(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """
     Register a new user.
 
@@ -35,7 +36,7 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
         HTTPException: If username or email already exists
     """
     # Check if username already exists
-    existing_user = db.query(User).filter(User.username == user_data.username).first()
+    existing_user = await db.scalar(select(User).where(User.username == user_data.username))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -43,7 +44,7 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
         )
 
     # Check if email already exists
-    existing_email = db.query(User).filter(User.email == user_data.email).first()
+    existing_email = await db.scalar(select(User).where(User.email == user_data.email))
     if existing_email:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -63,13 +64,13 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
         )
 
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        await db.refresh(new_user)
 
         return new_user
 
     except IntegrityError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User registration failed. Username or email may already exist."
@@ -77,7 +78,7 @@ async def signup(user_data: UserCreate, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
-async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(user_credentials: UserLogin, db: AsyncSession = Depends(get_db)):
     """
     Authenticate user and return JWT token.
 
@@ -92,7 +93,7 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
         HTTPException: If credentials are invalid
     """
     # Find user by username
-    user = db.query(User).filter(User.username == user_credentials.username).first()
+    user = await db.scalar(select(User).where(User.username == user_credentials.username))
 
     # Verify user exists and password is correct
     if not user or not verify_password(user_credentials.password, user.hashed_password):
@@ -111,7 +112,7 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
 
     # Create access token
     access_token = create_access_token(
-        data={"sub": user.id, "username": user.username}
+        data={"sub": str(user.id), "username": user.username}
     )
 
     return {"access_token": access_token, "token_type": "bearer"}
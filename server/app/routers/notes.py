@@ -1,79 +1,150 @@
-from typing import List, Optional
+import base64
+import json
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.dependencies import get_current_user, get_ai_service
-from app.db.models.note import Note
+from app.core.dependencies import get_current_user, get_enrichment_pool
+from app.db.models.note import ENRICHMENT_PENDING, Note
 from app.db.models.user import User
 from app.db.session import get_db
-from app.schemas.note_schema import NoteCreate, NoteResponse, NoteUpdate
-from app.services import AINoteService
+from app.schemas.note_schema import NoteBulkCreate, NoteCreate, NotePage, NoteResponse, NoteUpdate
+from app.services import EnrichmentWorkerPool
 
 router = APIRouter(prefix="/notes", tags=["Notes"])
 
 
-@router.get("", response_model=List[NoteResponse])
+def _encode_cursor(note: Note) -> str:
+    payload = json.dumps([note.is_pinned, note.updated_at.isoformat(), note.id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[bool, datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        is_pinned, updated_at, note_id = json.loads(base64.urlsafe_b64decode(padded))
+        return bool(is_pinned), datetime.fromisoformat(updated_at), int(note_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+@router.get("", response_model=NotePage)
 async def list_notes(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
     search: Optional[str] = Query(default=None, description="Filter notes by title/content"),
     include_archived: bool = Query(default=False, description="Include archived notes in the response"),
+    limit: int = Query(default=50, ge=1, le=200, description="Maximum number of notes to return"),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
 ):
-    """Return notes owned by the current user."""
-    query = db.query(Note).filter(Note.owner_id == current_user.id)
+    """
+    Return a page of notes owned by the current user.
+
+    Pages are keyset-paginated over (is_pinned, updated_at, id), so deep
+    pages cost the same as the first one.
+    """
+    query = select(Note).where(Note.owner_id == current_user.id)
 
     if not include_archived:
-        query = query.filter(Note.is_archived.is_(False))
+        query = query.where(Note.is_archived.is_(False))
 
     if search:
         like_query = f"%{search.lower()}%"
-        query = query.filter(
+        query = query.where(
             (Note.title.ilike(like_query)) | (Note.content.ilike(like_query))
         )
 
-    notes = query.order_by(Note.is_pinned.desc(), Note.updated_at.desc()).all()
-    return notes
+    if cursor:
+        query = query.where(
+            tuple_(Note.is_pinned, Note.updated_at, Note.id) < tuple_(*_decode_cursor(cursor))
+        )
+
+    result = await db.scalars(
+        query.order_by(Note.is_pinned.desc(), Note.updated_at.desc(), Note.id.desc()).limit(limit + 1)
+    )
+    notes = result.all()
+
+    next_cursor = None
+    if len(notes) > limit:
+        notes = notes[:limit]
+        next_cursor = _encode_cursor(notes[-1])
+    return NotePage(items=notes, next_cursor=next_cursor)
 
 
 @router.post("", response_model=NoteResponse, status_code=status.HTTP_201_CREATED)
 async def create_note(
     note_data: NoteCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-    ai_service: AINoteService = Depends(get_ai_service),
+    enrichment_pool: EnrichmentWorkerPool = Depends(get_enrichment_pool),
 ):
-    """Create a note and optionally enrich it via Gemini."""
-    enrichment_summary = None
-    enrichment_tags = None
-
-    if note_data.use_ai:
-        ai_result = ai_service.enrich(
-            title=note_data.title,
-            content=note_data.content,
-            manual_tags=note_data.tags,
-        )
-        enrichment_summary = ai_result.summary
-        enrichment_tags = ai_result.tags
-
+    """Create a note and optionally queue Gemini enrichment in the background."""
     note = Note(
         owner_id=current_user.id,
         title=note_data.title,
         content=note_data.content,
         tags=note_data.tags,
-        ai_summary=enrichment_summary,
-        ai_tags=enrichment_tags,
+        enrichment_status=ENRICHMENT_PENDING if note_data.use_ai else None,
         is_pinned=note_data.is_pinned,
         is_archived=note_data.is_archived,
     )
     db.add(note)
-    db.commit()
-    db.refresh(note)
+    await db.commit()
+    await db.refresh(note)
+
+    if note.enrichment_status == ENRICHMENT_PENDING:
+        enrichment_pool.submit(note.id)
     return note
 
 
-def _get_note(db: Session, note_id: int, user_id: int) -> Note:
-    note = db.query(Note).filter(Note.id == note_id, Note.owner_id == user_id).first()
+@router.post("/bulk", response_model=List[NoteResponse], status_code=status.HTTP_201_CREATED)
+async def bulk_create_notes(
+    payload: NoteBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    enrichment_pool: EnrichmentWorkerPool = Depends(get_enrichment_pool),
+):
+    """
+    Create many notes in a single transaction.
+
+    Notes that request AI are queued together so the workers enrich them
+    with batched Gemini prompts (``AINoteService.enrich_many``).
+    """
+    notes = [
+        Note(
+            owner_id=current_user.id,
+            title=note_data.title,
+            content=note_data.content,
+            tags=note_data.tags,
+            enrichment_status=ENRICHMENT_PENDING if note_data.use_ai else None,
+            is_pinned=note_data.is_pinned,
+            is_archived=note_data.is_archived,
+        )
+        for note_data in payload.notes
+    ]
+    db.add_all(notes)
+    await db.flush()
+    note_ids = [note.id for note in notes]
+    await db.commit()
+
+    # Reload server defaults for every note in one query instead of N refreshes.
+    result = await db.scalars(
+        select(Note)
+        .where(Note.id.in_(note_ids))
+        .order_by(Note.id)
+        .execution_options(populate_existing=True)
+    )
+    notes = result.all()
+
+    enrichment_pool.submit_many(note.id for note in notes if note.enrichment_status == ENRICHMENT_PENDING)
+    return notes
+
+
+async def _get_note(db: AsyncSession, note_id: int, user_id: int) -> Note:
+    note = await db.scalar(select(Note).where(Note.id == note_id, Note.owner_id == user_id))
     if not note:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Note not found")
     return note
@@ -82,11 +153,11 @@ def _get_note(db: Session, note_id: int, user_id: int) -> Note:
 @router.get("/{note_id}", response_model=NoteResponse)
 async def get_note(
     note_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Fetch a single note."""
-    note = _get_note(db, note_id, current_user.id)
+    note = await _get_note(db, note_id, current_user.id)
     return note
 
 
@@ -94,12 +165,12 @@ async def get_note(
 async def update_note(
     note_id: int,
     note_data: NoteUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
-    ai_service: AINoteService = Depends(get_ai_service),
+    enrichment_pool: EnrichmentWorkerPool = Depends(get_enrichment_pool),
 ):
-    """Update a note. AI enrichment re-runs when content/title changes or regenerate_ai is set."""
-    note = _get_note(db, note_id, current_user.id)
+    """Update a note. AI enrichment is re-queued when content/title changes or regenerate_ai is set."""
+    note = await _get_note(db, note_id, current_user.id)
 
     content_changed = False
     if note_data.title is not None and note_data.title != note.title:
@@ -116,29 +187,27 @@ async def update_note(
     if note_data.is_archived is not None:
         note.is_archived = note_data.is_archived
 
-    if note_data.regenerate_ai or content_changed:
-        ai_result = ai_service.enrich(
-            title=note.title,
-            content=note.content,
-            manual_tags=note.tags,
-        )
-        note.ai_summary = ai_result.summary
-        note.ai_tags = ai_result.tags
+    requeue = note_data.regenerate_ai or content_changed
+    if requeue:
+        note.enrichment_status = ENRICHMENT_PENDING
 
     db.add(note)
-    db.commit()
-    db.refresh(note)
+    await db.commit()
+    await db.refresh(note)
+
+    if requeue:
+        enrichment_pool.submit(note.id)
     return note
 
 
 @router.delete("/{note_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_note(
     note_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """Delete a note owned by the user."""
-    note = _get_note(db, note_id, current_user.id)
-    db.delete(note)
-    db.commit()
+    note = await _get_note(db, note_id, current_user.id)
+    await db.delete(note)
+    await db.commit()
     return None
@@ -19,10 +19,16 @@ class NoteCreate(NoteBase):
 
     use_ai: bool = Field(
         default=True,
-        description="When true, the backend will call Gemini to create summaries and tags.",
+        description="When true, the backend queues Gemini enrichment to create summaries and tags.",
     )
 
 
+class NoteBulkCreate(BaseModel):
+    """Payload for creating many notes in one request."""
+
+    notes: List[NoteCreate] = Field(..., min_length=1, max_length=500)
+
+
 class NoteUpdate(BaseModel):
     """Payload for updating an existing note."""
 
@@ -48,8 +54,22 @@ class NoteResponse(BaseModel):
     content: str
     ai_summary: Optional[str] = None
     ai_tags: Optional[List[str]] = None
+    enrichment_status: Optional[str] = Field(
+        default=None,
+        description="Background AI enrichment state: pending, done or failed (null when not requested).",
+    )
     tags: Optional[List[str]] = None
     is_pinned: bool
     is_archived: bool
     created_at: datetime
     updated_at: datetime
+
+
+class NotePage(BaseModel):
+    """One keyset-paginated page of notes."""
+
+    items: List[NoteResponse]
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor for the next page; null when this is the last page.",
+    )
@@ -1,3 +1,5 @@
-from app.services.ai_notes import AINoteService, AIResult
+from app.services.ai_notes import AINoteService, AIResult, EnrichmentItem
+from app.services.enrichment_cache import EnrichmentCache
+from app.services.enrichment_worker import EnrichmentWorkerPool
 
-__all__ = ["AINoteService", "AIResult"]
+__all__ = ["AINoteService", "AIResult", "EnrichmentItem", "EnrichmentCache", "EnrichmentWorkerPool"]
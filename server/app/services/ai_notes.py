@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Tuple
 
 try:
     import google.generativeai as genai
@@ -10,6 +11,9 @@ except Exception:  # pragma: no cover - optional dependency during tests
 
 from app.core.config import get_settings
 
+if TYPE_CHECKING:
+    from app.services.enrichment_cache import EnrichmentCache
+
 
 @dataclass
 class AIResult:
@@ -19,12 +23,28 @@ class AIResult:
     tags: Optional[List[str]]
 
 
+@dataclass
+class EnrichmentItem:
+    """A single note to enrich as part of ``AINoteService.enrich_many``."""
+
+    title: str
+    content: str
+    manual_tags: Optional[List[str]] = None
+
+
 class AINoteService:
     """Lightweight wrapper around Gemini to summarize and tag notes."""
 
-    def __init__(self, model_name: str = "gemini-1.5-flash"):
+    def __init__(
+        self,
+        model_name: str = "gemini-1.5-flash",
+        cache: Optional["EnrichmentCache"] = None,
+        batch_size: int = 10,
+    ):
         self.settings = get_settings()
         self.model_name = model_name
+        self.cache = cache
+        self.batch_size = max(1, batch_size)
         self._client = None
 
     def _ensure_client(self) -> None:
@@ -40,6 +60,8 @@ class AINoteService:
         Generate AI summary and tags for the given note content.
 
         Falls back to deterministic heuristics when Gemini is unavailable.
+        Gemini results are cached by content hash; fallback results are cheap
+        and are never cached so a recovered upstream gets used again.
         """
         summary: Optional[str] = None
         tags: Optional[List[str]] = manual_tags
@@ -48,6 +70,12 @@ class AINoteService:
         if self.settings.GEMINI_API_KEY and genai:
             self._ensure_client()
             if self._client:
+                cache_key = None
+                if self.cache is not None:
+                    cache_key = self.cache.make_key(self.model_name, title, content, manual_tags)
+                    cached = self.cache.get(cache_key)
+                    if cached is not None:
+                        return cached
                 prompt = (
                     "You are an assistant that summarizes notes and extracts concise tags.\n"
                     f"Title: {title}\n\n"
@@ -60,6 +88,9 @@ class AINoteService:
                     summary, tags = self._parse_response(text, manual_tags)
                 except Exception:
                     summary, tags = self._fallback_processing(title, content, manual_tags)
+                else:
+                    if cache_key is not None:
+                        self.cache.set(cache_key, self.model_name, AIResult(summary=summary, tags=tags))
             else:
                 summary, tags = self._fallback_processing(title, content, manual_tags)
         else:
@@ -67,6 +98,90 @@ class AINoteService:
 
         return AIResult(summary=summary, tags=tags)
 
+    def enrich_many(self, items: Sequence[EnrichmentItem]) -> List[AIResult]:
+        """
+        Enrich several notes with one Gemini round trip per ``batch_size`` notes.
+
+        Results are returned in input order. Cached items skip the upstream
+        call, and any entry Gemini omits or garbles falls back individually.
+        """
+        results: List[Optional[AIResult]] = [None] * len(items)
+
+        self._ensure_client()
+        if not (self.settings.GEMINI_API_KEY and genai and self._client):
+            return [self._fallback_result(item) for item in items]
+
+        pending: List[Tuple[int, Optional[str]]] = []
+        for index, item in enumerate(items):
+            cache_key = None
+            if self.cache is not None:
+                cache_key = self.cache.make_key(self.model_name, item.title, item.content, item.manual_tags)
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    results[index] = cached
+                    continue
+            pending.append((index, cache_key))
+
+        for start in range(0, len(pending), self.batch_size):
+            chunk = pending[start:start + self.batch_size]
+            chunk_items = [items[index] for index, _ in chunk]
+            try:
+                response = self._client.generate_content(self._build_batch_prompt(chunk_items))
+                entries = self._parse_batch_response(response.text.strip(), len(chunk_items))
+            except Exception:
+                entries = [None] * len(chunk_items)
+
+            for (index, cache_key), item, entry in zip(chunk, chunk_items, entries):
+                if entry is None:
+                    results[index] = self._fallback_result(item)
+                    continue
+                tags = entry.get("tags") or (item.manual_tags[:] if item.manual_tags else None)
+                if isinstance(tags, str):
+                    tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
+                results[index] = AIResult(summary=entry["summary"], tags=tags)
+                if cache_key is not None:
+                    self.cache.set(cache_key, self.model_name, results[index])
+
+        return results
+
+    def _fallback_result(self, item: EnrichmentItem) -> AIResult:
+        summary, tags = self._fallback_processing(item.title, item.content, item.manual_tags)
+        return AIResult(summary=summary, tags=tags)
+
+    @staticmethod
+    def _build_batch_prompt(items: Sequence[EnrichmentItem]) -> str:
+        sections = [
+            f"### Note {index}\nTitle: {item.title}\n\nContent:\n{item.content}"
+            for index, item in enumerate(items)
+        ]
+        return (
+            "You are an assistant that summarizes notes and extracts concise tags.\n"
+            f"Below are {len(items)} independent notes.\n\n"
+            + "\n\n".join(sections)
+            + "\n\nReturn a JSON array with exactly one object per note, in order. Each object has "
+            "`index` (the note number), `summary` (<=80 words) and `tags` (3-6 short tags)."
+        )
+
+    @staticmethod
+    def _parse_batch_response(raw_text: str, count: int) -> List[Optional[dict]]:
+        """Split a batched Gemini reply into per-note entries; unusable entries are None."""
+        raw_text = raw_text.replace("```json", "").replace("```", "").strip()
+        entries: List[Optional[dict]] = [None] * count
+        try:
+            data: Any = json.loads(raw_text)
+        except ValueError:
+            return entries
+        if not isinstance(data, list):
+            return entries
+
+        for position, entry in enumerate(data):
+            if not isinstance(entry, dict) or not isinstance(entry.get("summary"), str):
+                continue
+            index = entry.get("index", position)
+            if isinstance(index, int) and 0 <= index < count and entries[index] is None:
+                entries[index] = entry
+        return entries
+
     @staticmethod
     def _fallback_processing(title: str, content: str, manual_tags: Optional[List[str]]) -> Tuple[str, List[str]]:
         """Provide deterministic summary/tags to keep UX smooth offline."""
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.db.models.enrichment_cache import EnrichmentCacheEntry
+from app.db.session import SessionLocal
+from app.services.ai_notes import AIResult
+
+logger = logging.getLogger(__name__)
+
+
+class EnrichmentCache:
+    """
+    Two-tier cache for AI enrichment results.
+
+    Tier one is a bounded in-process LRU; tier two is the
+    ``ai_enrichment_cache`` table, which survives restarts and is shared by
+    every worker. Both tiers expire entries after ``ttl_seconds``; the table
+    is trimmed to ``max_db_rows`` every ``prune_interval`` writes.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: int = 7 * 24 * 3600,
+        session_factory: Optional[Callable[[], Session]] = SessionLocal,
+        max_db_rows: int = 100_000,
+        prune_interval: int = 500,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.session_factory = session_factory
+        self.max_db_rows = max_db_rows
+        self.prune_interval = prune_interval
+        self._entries: "OrderedDict[str, Tuple[float, AIResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(model_name: str, title: str, content: str, manual_tags: Optional[List[str]]) -> str:
+        """Stable content hash of everything that influences an enrichment result."""
+        payload = json.dumps([model_name, title, content, manual_tags or []], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[AIResult]:
+        """Return a cached result, promoting database hits into memory."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.memory_hits += 1
+                    return result
+                del self._entries[key]
+                self.evictions += 1
+
+        result, expires_at = self._db_get(key, now)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.db_hits += 1
+            self._remember(key, result, expires_at)
+        return result
+
+    def set(self, key: str, model_name: str, result: AIResult) -> None:
+        """Store a result in both tiers."""
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        with self._lock:
+            self._remember(key, result, expires_at)
+            self._writes_since_prune += 1
+            should_prune = self._writes_since_prune >= self.prune_interval
+            if should_prune:
+                self._writes_since_prune = 0
+        self._db_set(key, model_name, result, int(now), int(expires_at))
+        if should_prune:
+            self.prune()
+
+    def clear(self) -> None:
+        """Drop the in-memory tier (the table is left untouched)."""
+        with self._lock:
+            self._entries.clear()
+
+    def prune(self) -> int:
+        """Delete expired rows and trim the table to ``max_db_rows``. Returns rows removed."""
+        if self.session_factory is None:
+            return 0
+        try:
+            with self.session_factory() as db:
+                removed = db.execute(
+                    delete(EnrichmentCacheEntry).where(EnrichmentCacheEntry.expires_at <= int(time.time()))
+                ).rowcount
+                overflow = db.scalar(select(func.count()).select_from(EnrichmentCacheEntry)) - self.max_db_rows
+                if overflow > 0:
+                    oldest = (
+                        select(EnrichmentCacheEntry.key)
+                        .order_by(EnrichmentCacheEntry.expires_at)
+                        .limit(overflow)
+                        .scalar_subquery()
+                    )
+                    removed += db.execute(
+                        delete(EnrichmentCacheEntry).where(EnrichmentCacheEntry.key.in_(oldest))
+                    ).rowcount
+                db.commit()
+                return removed
+        except SQLAlchemyError:
+            logger.exception("Failed to prune enrichment cache table")
+            return 0
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for monitoring."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "memory_hits": self.memory_hits,
+                "db_hits": self.db_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _remember(self, key: str, result: AIResult, expires_at: float) -> None:
+        # Caller holds the lock.
+        self._entries[key] = (expires_at, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _db_get(self, key: str, now: float) -> Tuple[Optional[AIResult], float]:
+        if self.session_factory is None:
+            return None, 0.0
+        try:
+            with self.session_factory() as db:
+                row = db.get(EnrichmentCacheEntry, key)
+                if row is None or row.expires_at <= now:
+                    return None, 0.0
+                return AIResult(summary=row.summary, tags=row.tags), float(row.expires_at)
+        except SQLAlchemyError:
+            logger.exception("Enrichment cache lookup failed")
+            return None, 0.0
+
+    def _db_set(self, key: str, model_name: str, result: AIResult, created_at: int, expires_at: int) -> None:
+        if self.session_factory is None:
+            return
+        try:
+            with self.session_factory() as db:
+                db.merge(
+                    EnrichmentCacheEntry(
+                        key=key,
+                        model_name=model_name,
+                        summary=result.summary,
+                        tags=result.tags,
+                        created_at=created_at,
+                        expires_at=expires_at,
+                    )
+                )
+                db.commit()
+        except SQLAlchemyError:
+            # Another worker may have stored the same key concurrently.
+            logger.debug("Enrichment cache write skipped for %s", key, exc_info=True)
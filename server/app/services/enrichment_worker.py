@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Iterable, List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.db.models.note import (
+    ENRICHMENT_DONE,
+    ENRICHMENT_FAILED,
+    ENRICHMENT_PENDING,
+    Note,
+)
+from app.db.session import SessionLocal
+from app.services.ai_notes import AINoteService, AIResult, EnrichmentItem
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class EnrichmentWorkerPool:
+    """
+    Fixed-size pool of threads that enrich notes outside the request path.
+
+    Handlers commit the note with ``enrichment_status="pending"`` and submit
+    its id; a worker later takes up to ``batch_size`` queued ids at once,
+    calls ``AINoteService.enrich_many`` and writes the summaries/tags back.
+    The queue is in-memory, so pending notes are re-submitted on startup via
+    ``requeue_pending``.
+    """
+
+    def __init__(
+        self,
+        ai_service: AINoteService,
+        session_factory: Callable[[], Session] = SessionLocal,
+        workers: int = 2,
+        max_queue_size: int = 0,
+        batch_size: int = 1,
+    ):
+        self.ai_service = ai_service
+        self.session_factory = session_factory
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self._queue: "queue.Queue[object]" = queue.Queue(maxsize=max_queue_size)
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return any(thread.is_alive() for thread in self._threads)
+
+    def start(self) -> None:
+        """Spawn the worker threads (no-op when already running)."""
+        with self._lock:
+            if self.running:
+                return
+            self._threads = [
+                threading.Thread(target=self._run, name=f"enrichment-worker-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Ask every worker to exit once the queued jobs ahead of it are done."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+            for _ in threads:
+                self._queue.put(_STOP)
+        for thread in threads:
+            thread.join(timeout)
+
+    def submit(self, note_id: int) -> bool:
+        """
+        Queue a note for enrichment.
+
+        Returns False when the queue is full; the note stays pending and is
+        picked up again by ``requeue_pending`` on the next start.
+        """
+        try:
+            self._queue.put_nowait(note_id)
+        except queue.Full:
+            logger.warning("Enrichment queue full, leaving note %s pending", note_id)
+            return False
+        return True
+
+    def submit_many(self, note_ids: Iterable[int]) -> int:
+        """Queue several notes, returning how many were accepted."""
+        return sum(1 for note_id in note_ids if self.submit(note_id))
+
+    def requeue_pending(self) -> int:
+        """Re-submit notes left pending by a previous process."""
+        with self.session_factory() as db:
+            note_ids = db.scalars(
+                select(Note.id).where(Note.enrichment_status == ENRICHMENT_PENDING).order_by(Note.id)
+            ).all()
+        return self.submit_many(note_ids)
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Block until every queued job has been processed. Returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def process(self, note_id: int) -> None:
+        """Enrich a single pending note and persist the result."""
+        self.process_many([note_id])
+
+    def process_many(self, note_ids: List[int]) -> None:
+        """Enrich a batch of pending notes with one upstream call and persist the results."""
+        with self.session_factory() as db:
+            rows = db.execute(
+                select(Note.id, Note.title, Note.content, Note.tags).where(
+                    Note.id.in_(note_ids), Note.enrichment_status == ENRICHMENT_PENDING
+                )
+            ).all()
+        if not rows:
+            return
+
+        # The upstream call happens with no session or transaction held open.
+        items = [
+            EnrichmentItem(title=row.title, content=row.content, manual_tags=list(row.tags) if row.tags else None)
+            for row in rows
+        ]
+        status = ENRICHMENT_DONE
+        try:
+            if len(items) == 1:
+                results = [self.ai_service.enrich(items[0].title, items[0].content, items[0].manual_tags)]
+            else:
+                results = self.ai_service.enrich_many(items)
+        except Exception:
+            logger.exception("Enrichment failed for notes %s", [row.id for row in rows])
+            results = [AIResult(summary=None, tags=None)] * len(rows)
+            status = ENRICHMENT_FAILED
+
+        self._store(rows, results, status)
+
+    def _store(self, rows, results: List[AIResult], status: str) -> None:
+        # Only write back if a note still holds the text that was enriched;
+        # an edit in the meantime has already queued a fresh job. updated_at
+        # is pinned so enrichment does not reorder the user's notes.
+        with self.session_factory() as db:
+            for row, result in zip(rows, results):
+                values = {"enrichment_status": status, "updated_at": Note.updated_at}
+                if status == ENRICHMENT_DONE:
+                    values.update(ai_summary=result.summary, ai_tags=result.tags)
+                db.execute(
+                    update(Note)
+                    .where(
+                        Note.id == row.id,
+                        Note.enrichment_status == ENRICHMENT_PENDING,
+                        Note.title == row.title,
+                        Note.content == row.content,
+                    )
+                    .values(**values)
+                )
+            db.commit()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while batch[-1] is not _STOP and len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is _STOP
+            note_ids = [item for item in batch if item is not _STOP]
+            try:
+                if note_ids:
+                    self.process_many(note_ids)
+            except Exception:
+                logger.exception("Enrichment worker error for notes %s", note_ids)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
@@ -0,0 +1,103 @@
+import os
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
+from app.core.config import Settings
+from app.db.base import Base
+from app.db.session import SessionLocal, engine
+from app.services import AINoteService, AIResult, EnrichmentCache
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeGemini:
+    def __init__(self):
+        self.calls = 0
+
+    def generate_content(self, prompt: str) -> FakeResponse:
+        self.calls += 1
+        return FakeResponse('{"summary": "cached summary", "tags": ["one", "two"]}')
+
+
+def setup_module(module):
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+def teardown_module(module):
+    Base.metadata.drop_all(bind=engine)
+
+
+def make_service(cache: EnrichmentCache) -> AINoteService:
+    service = AINoteService(cache=cache)
+    service.settings = Settings(GEMINI_API_KEY="test-key")
+    service._client = FakeGemini()
+    return service
+
+
+def test_repeat_enrichment_hits_memory_then_database():
+    service = make_service(EnrichmentCache(session_factory=SessionLocal))
+
+    first = service.enrich("Title", "Body text", ["manual"])
+    second = service.enrich("Title", "Body text", ["manual"])
+    assert first == second == AIResult(summary="cached summary", tags=["one", "two"])
+    assert service._client.calls == 1
+    assert service.cache.stats()["memory_hits"] == 1
+
+    # A fresh process only shares the table.
+    restarted = make_service(EnrichmentCache(session_factory=SessionLocal))
+    assert restarted.enrich("Title", "Body text", ["manual"]).summary == "cached summary"
+    assert restarted._client.calls == 0
+    assert restarted.cache.stats()["db_hits"] == 1
+
+    restarted.enrich("Title", "Edited body", ["manual"])
+    assert restarted._client.calls == 1
+    assert restarted.cache.stats()["misses"] == 1
+
+
+def test_lru_and_ttl_eviction():
+    cache = EnrichmentCache(max_size=2, session_factory=None)
+    for key in ("a", "b", "c"):
+        cache.set(key, "model", AIResult(summary=key, tags=None))
+    assert cache.get("a") is None
+    assert cache.get("c").summary == "c"
+
+    expired = EnrichmentCache(ttl_seconds=-1, session_factory=None)
+    expired.set("a", "model", AIResult(summary="a", tags=None))
+    assert expired.get("a") is None
+    assert expired.stats()["evictions"] == 1
+
+
+class FakeBatchGemini:
+    def __init__(self, text: str):
+        self.text = text
+        self.calls = 0
+
+    def generate_content(self, prompt: str) -> FakeResponse:
+        self.calls += 1
+        return FakeResponse(self.text)
+
+
+def test_enrich_many_parses_array_and_falls_back_per_item():
+    from app.services import EnrichmentItem
+
+    service = AINoteService(cache=EnrichmentCache(session_factory=None), batch_size=3)
+    service.settings = Settings(GEMINI_API_KEY="test-key")
+    service._client = FakeBatchGemini(
+        '```json\n[{"index": 0, "summary": "first", "tags": "a, b"},'
+        ' {"index": 1, "tags": ["missing summary"]},'
+        ' {"index": 2, "summary": "third", "tags": ["c"]}]\n```'
+    )
+    items = [EnrichmentItem(title=f"Note {i}", content=f"Content body {i}") for i in range(4)]
+
+    results = service.enrich_many(items)
+
+    assert service._client.calls == 2  # batch_size=3 -> two round trips for four notes
+    assert results[0] == AIResult(summary="first", tags=["a", "b"])
+    assert results[1].summary.startswith("Note 1")  # malformed entry -> fallback
+    assert results[2] == AIResult(summary="third", tags=["c"])
+    assert results[3] == AIResult(summary="first", tags=["a", "b"])  # second chunk reuses index 0
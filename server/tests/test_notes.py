@@ -4,19 +4,14 @@ os.environ.setdefault("DATABASE_URL", "sqlite:///./test.db")
 os.environ.setdefault("SECRET_KEY", "test-secret-key")
 
 from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
-
 from app.db.base import Base
-from app.db.session import SessionLocal, engine, get_db
+from app.db.session import AsyncSessionLocal, engine, get_db
 from app.main import app
 
 
-def override_get_db():
-    db = SessionLocal()
-    try:
+async def override_get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 def setup_module(module):
@@ -58,13 +53,17 @@ def test_note_crud_flow():
         }
         create_resp = client.post("/api/notes", json=note_payload, headers=headers)
         assert create_resp.status_code == 201
+        assert create_resp.json()["enrichment_status"] == "pending"
         note_id = create_resp.json()["id"]
 
+        assert app.state.enrichment_pool.drain(timeout=10)
+
         list_resp = client.get("/api/notes", headers=headers)
         assert list_resp.status_code == 200
-        notes = list_resp.json()
+        notes = list_resp.json()["items"]
         assert len(notes) == 1
         assert notes[0]["ai_summary"] is not None
+        assert notes[0]["enrichment_status"] == "done"
 
         update_resp = client.put(
             f"/api/notes/{note_id}",
@@ -73,10 +72,63 @@ def test_note_crud_flow():
         )
         assert update_resp.status_code == 200
         assert update_resp.json()["title"] == "v2 plan"
+        assert update_resp.json()["enrichment_status"] == "pending"
+
+        assert app.state.enrichment_pool.drain(timeout=10)
+        get_resp = client.get(f"/api/notes/{note_id}", headers=headers)
+        assert get_resp.json()["enrichment_status"] == "done"
+        assert get_resp.json()["ai_summary"].startswith("v2 plan")
 
         delete_resp = client.delete(f"/api/notes/{note_id}", headers=headers)
         assert delete_resp.status_code == 204
 
         list_resp = client.get("/api/notes", headers=headers)
         assert list_resp.status_code == 200
-        assert list_resp.json() == []
+        assert list_resp.json() == {"items": [], "next_cursor": None}
+
+
+def test_bulk_create_enriches_in_batches():
+    with TestClient(app) as client:
+        login_resp = client.post("/api/auth/login", json={"username": "demo", "password": "strongpassword"})
+        headers = {"Authorization": f"Bearer {login_resp.json()['access_token']}"}
+
+        payload = {
+            "notes": [
+                {"title": f"Imported {i}", "content": f"Backfilled content number {i}."}
+                for i in range(5)
+            ]
+            + [{"title": "Plain", "content": "No AI here.", "use_ai": False}]
+        }
+        resp = client.post("/api/notes/bulk", json=payload, headers=headers)
+        assert resp.status_code == 201
+        created = resp.json()
+        assert [note["title"] for note in created][:2] == ["Imported 0", "Imported 1"]
+        assert [note["enrichment_status"] for note in created].count("pending") == 5
+
+        assert app.state.enrichment_pool.drain(timeout=10)
+        notes = client.get("/api/notes", headers=headers).json()["items"]
+        statuses = {note["title"]: note["enrichment_status"] for note in notes}
+        assert statuses["Plain"] is None
+        assert all(statuses[f"Imported {i}"] == "done" for i in range(5))
+
+
+def test_list_notes_keyset_pagination():
+    with TestClient(app) as client:
+        login_resp = client.post("/api/auth/login", json={"username": "demo", "password": "strongpassword"})
+        headers = {"Authorization": f"Bearer {login_resp.json()['access_token']}"}
+
+        client.post("/api/notes", json={"title": "Pinned", "content": "Top", "is_pinned": True, "use_ai": False}, headers=headers)
+        expected = [note["id"] for note in client.get("/api/notes?limit=200", headers=headers).json()["items"]]
+        assert len(expected) == 7
+
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+            page = client.get("/api/notes", params=params, headers=headers).json()
+            seen.extend(note["id"] for note in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == expected
+        assert client.get("/api/notes", params={"cursor": "garbage"}, headers=headers).status_code == 400